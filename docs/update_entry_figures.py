@@ -5,15 +5,20 @@ example entries found in
 are coming from this script.
 """
 
+import concurrent.futures
+import hashlib
+import importlib.metadata
 import io
+import os
 import pathlib
 import shutil
 import tempfile
+from typing import Any
 
 import fitz
-import pdfCropMargins
 import pydantic
 import ruamel.yaml
+import typst
 
 import rendercv.data as data
 import rendercv.renderer as renderer
@@ -21,6 +26,14 @@ import rendercv.renderer as renderer
 repository_root = pathlib.Path(__file__).parent.parent
 rendercv_path = repository_root / "rendercv"
 image_assets_directory = pathlib.Path(__file__).parent / "assets" / "images"
+entry_figures_cache_directory = (
+    pathlib.Path(__file__).parent / ".cache" / "entry_figures"
+)
+
+# The YAML object is configured once and reused for all the entries:
+yaml_object = ruamel.yaml.YAML()
+yaml_object.width = 60
+yaml_object.indent(mapping=2, sequence=4, offset=2)
 
 
 class SampleEntries(pydantic.BaseModel):
@@ -41,9 +54,6 @@ def dictionary_to_yaml(dictionary: dict):
     Returns:
         The YAML string.
     """
-    yaml_object = ruamel.yaml.YAML()
-    yaml_object.width = 60
-    yaml_object.indent(mapping=2, sequence=4, offset=2)
     with io.StringIO() as string_stream:
         yaml_object.dump(dictionary, string_stream)
         return string_stream.getvalue()
@@ -120,32 +130,128 @@ def define_env(env):
     env.variables["available_social_networks"] = ", ".join(social_networks)
 
 
-def render_pngs_from_pdf(pdf_file_path: pathlib.Path) -> list[pathlib.Path]:
-    """Render a PNG file for each page of the given PDF file.
+def crop_top_and_bottom_margins_of_a_pdf(
+    pdf_file_path: pathlib.Path, padding: float = 30
+) -> fitz.Document:
+    """Crop the top and bottom margins of each page of the given PDF file to the
+    content of the page, leaving `padding` points above and below the content. The left
+    and right margins are kept as they are. The PDF file itself is not modified.
 
     Args:
         pdf_file_path: The path to the PDF file.
+        padding: The space to leave above and below the content, in points.
 
     Returns:
-        The paths to the rendered PNG files.
+        The cropped PDF document, in memory.
     """
-    # check if the file exists:
-    if not pdf_file_path.is_file():
-        message = f"The file {pdf_file_path} doesn't exist!"
-        raise FileNotFoundError(message)
+    pdf = fitz.open(pdf_file_path)
+    for page in pdf:
+        # Find the bounding box of everything drawn on the page:
+        content_box = fitz.EMPTY_RECT()
+        for _, rectangle in page.get_bboxlog():
+            content_box |= fitz.Rect(rectangle)
+
+        media_box = page.mediabox
+        crop_box = fitz.Rect(
+            media_box.x0,
+            content_box.y0 - padding,
+            media_box.x1,
+            content_box.y1 + padding,
+        )
+        page.set_cropbox(crop_box & media_box)
 
-    # convert the PDF to PNG:
-    png_directory = pdf_file_path.parent
-    png_file_name = pdf_file_path.stem
-    png_files = []
-    pdf = fitz.open(pdf_file_path)  # open the PDF file
-    for page in pdf:  # iterate the pages
-        image = page.get_pixmap(dpi=300)  # type: ignore
-        png_file_path = png_directory / f"{png_file_name}_{page.number + 1}.png"  # type: ignore
-        image.save(png_file_path)
-        png_files.append(png_file_path)
+    return pdf
 
-    return png_files
+
+def compute_entry_figure_cache_key(typst_file_contents: str) -> str:
+    """Compute a key that changes whenever the figure rendered from the given Typst file
+    would change: the Typst file itself, the Typst compiler and the fonts, or this
+    script.
+
+    The Typst file is generated from the data model, so it already contains every
+    resolved design option, locale, and template.
+
+    Args:
+        typst_file_contents: The contents of the Typst file of the entry.
+
+    Returns:
+        The cache key as a hexadecimal string.
+    """
+    hasher = hashlib.blake2b(typst_file_contents.encode("utf-8"))
+    hasher.update(typst.__version__.encode("utf-8"))
+    hasher.update(importlib.metadata.version("rendercv-fonts").encode("utf-8"))
+    hasher.update(pathlib.Path(__file__).read_bytes())
+
+    return hasher.hexdigest()
+
+
+def generate_entry_figure(
+    entry_type: str,
+    entry: Any,
+    design_dictionary: dict,
+    temporary_directory_path: pathlib.Path,
+) -> pathlib.Path:
+    """Generate an image of the given entry with the given design options.
+
+    Each process works in its own subfolder of `temporary_directory_path`, so that the
+    calls can run in parallel with each other. The output folders are expected to exist.
+
+    Args:
+        entry_type: The type of the entry (e.g., `education_entry`).
+        entry: The entry itself.
+        design_dictionary: The design options, including the theme.
+        temporary_directory_path: The folder to write the intermediate files to.
+
+    Returns:
+        The path to the cached copy of the generated PNG file.
+    """
+    theme = design_dictionary["theme"]
+
+    desired_png_file_path = image_assets_directory / theme / f"{entry_type}.png"
+
+    # Create data model with only one section and one entry
+    data_model = data.RenderCVDataModel(
+        cv=data.CurriculumVitae(sections={entry_type: [entry]}),
+        design=design_dictionary,
+    )
+    typst_file_contents = renderer.create_contents_of_a_typst_file(data_model)
+
+    # Skip rendering if nothing has changed since the last run:
+    cache_key = compute_entry_figure_cache_key(typst_file_contents)
+    cached_png_file_path = entry_figures_cache_directory / f"{cache_key}.png"
+    if cached_png_file_path.is_file():
+        shutil.copyfile(cached_png_file_path, desired_png_file_path)
+        return cached_png_file_path
+
+    # Render. The built-in themes don't have auxiliary files and the sample entries
+    # don't have a photo, so there is nothing to copy next to the Typst file.
+    #
+    # All the figures rendered by the same process are written to the same Typst file,
+    # so that the Typst compiler, which is cached for the last file path, is created
+    # (and the fonts are loaded) only once per process:
+    typst_file_path = temporary_directory_path / str(os.getpid()) / "main.typ"
+    typst_file_path.parent.mkdir(exist_ok=True)
+    typst_file_path.write_text(typst_file_contents, encoding="utf-8")
+    pdf_file_path = renderer.render_a_pdf_from_typst(typst_file_path)
+
+    # Crop margins
+    cropped_pdf = crop_top_and_bottom_margins_of_a_pdf(pdf_file_path)
+
+    # Convert PDF to image. The documentation displays the images at around 800 pixels
+    # wide, so 180 DPI (1530 pixels for a letter page) is still sharp on high-density
+    # screens:
+    image = cropped_pdf[0].get_pixmap(dpi=180, alpha=False)  # type: ignore
+    image.save(desired_png_file_path)
+    cropped_pdf.close()
+
+    # Save the image to the cache for the next runs. Copy it to a temporary file first
+    # and then rename it, so that an interrupted copy never leaves a truncated image in
+    # the cache:
+    temporary_png_file_path = cached_png_file_path.with_suffix(f".{os.getpid()}.tmp")
+    shutil.copyfile(desired_png_file_path, temporary_png_file_path)
+    temporary_png_file_path.replace(cached_png_file_path)
+
+    return cached_png_file_path
 
 
 def generate_entry_figures():
@@ -157,83 +263,58 @@ def generate_entry_figures():
     entries = SampleEntries(**entries)
     themes = data.available_themes
 
-    with tempfile.TemporaryDirectory() as temporary_directory:
-        # Create temporary directory
-        temporary_directory_path = pathlib.Path(temporary_directory)
-        for theme in themes:
-            design_dictionary = {
-                "theme": theme,
-                "page": {
-                    "show_page_numbering": False,
-                    "show_last_updated_date": False,
-                },
-            }
+    # The design options only depend on the theme:
+    design_dictionaries = {
+        theme: {
+            "theme": theme,
+            "page": {
+                "show_page_numbering": False,
+                "show_last_updated_date": False,
+            },
+        }
+        for theme in themes
+    }
+
+    entry_types = [
+        "education_entry",
+        "experience_entry",
+        "normal_entry",
+        "publication_entry",
+        "one_line_entry",
+        "bullet_entry",
+        "text_entry",
+    ]
 
-            entry_types = [
-                "education_entry",
-                "experience_entry",
-                "normal_entry",
-                "publication_entry",
-                "one_line_entry",
-                "bullet_entry",
-                "text_entry",
-            ]
-            for entry_type in entry_types:
-                # Create data model with only one section and one entry
-                data_model = data.RenderCVDataModel(
-                    cv=data.CurriculumVitae(
-                        sections={entry_type: [getattr(entries, entry_type)]}
-                    ),
-                    design=design_dictionary,
-                )
-
-                # Render
-                typst_file_path = renderer.create_a_typst_file_and_copy_theme_files(
-                    data_model, temporary_directory_path
-                )
-                pdf_file_path = renderer.render_a_pdf_from_typst(typst_file_path)
-
-                # Prepare output directory and file path
-                output_directory = image_assets_directory / theme
-                output_directory.mkdir(parents=True, exist_ok=True)
-                output_pdf_file_path = output_directory / f"{entry_type}.pdf"
-
-                # Remove file if it exists
-                if output_pdf_file_path.exists():
-                    output_pdf_file_path.unlink()
-
-                # Crop margins
-                pdfCropMargins.crop(
-                    argv_list=[
-                        "-p4",
-                        "100",
-                        "0",
-                        "100",
-                        "0",
-                        "-a4",
-                        "0",
-                        "-30",
-                        "0",
-                        "-30",
-                        "-o",
-                        str(output_pdf_file_path.absolute()),
-                        str(pdf_file_path.absolute()),
-                    ]
-                )
-
-                # Convert PDF to image
-                png_file_path = render_pngs_from_pdf(output_pdf_file_path)[0]
-                desired_png_file_path = output_pdf_file_path.with_suffix(".png")
-
-                # If image exists, remove it
-                if desired_png_file_path.exists():
-                    desired_png_file_path.unlink()
-
-                # Move image to desired location
-                png_file_path.rename(desired_png_file_path)
-
-                # Remove PDF file
-                output_pdf_file_path.unlink()
+    # Create the output folders once, before dispatching the figures:
+    entry_figures_cache_directory.mkdir(parents=True, exist_ok=True)
+    for theme in themes:
+        (image_assets_directory / theme).mkdir(parents=True, exist_ok=True)
+
+    # Each (theme, entry type) pair is independent of the others, and Typst compilation
+    # is the dominant cost. Run them in separate processes:
+    with (
+        tempfile.TemporaryDirectory() as temporary_directory,
+        concurrent.futures.ProcessPoolExecutor() as executor,
+    ):
+        tasks = [
+            (
+                entry_type,
+                getattr(entries, entry_type),
+                design_dictionaries[theme],
+                pathlib.Path(temporary_directory),
+            )
+            for theme in themes
+            for entry_type in entry_types
+        ]
+        used_cache_files = set(
+            executor.map(generate_entry_figure, *zip(*tasks, strict=True))
+        )
+
+    # Remove the cached images that weren't used in this run (and the temporary files
+    # of the interrupted runs), so that the cache doesn't grow forever:
+    for cache_file in entry_figures_cache_directory.iterdir():
+        if cache_file not in used_cache_files:
+            cache_file.unlink()
 
 
 def update_index():
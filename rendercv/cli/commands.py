@@ -184,8 +184,10 @@ def cli_command_render(
 
         @printer.handle_and_print_raised_exceptions_without_exit
         def run_rendercv():
-            input_file_as_a_dict = u.update_render_command_settings_of_the_input_file(
-                data.read_a_yaml_file(input_file_path), cli_render_arguments
+            input_file_as_a_dict = u.read_and_construct_the_input(
+                input_file_path,
+                cli_render_arguments,
+                extra_data_model_override_arguments,
             )
             u.run_rendercv_with_printer(
                 input_file_as_a_dict, original_working_directory, input_file_path
@@ -2,13 +2,18 @@
 The `rendercv.cli.utilities` module contains utility functions that are required by CLI.
 """
 
+import ast
+import concurrent.futures
+import copy
+import functools
+import glob
 import inspect
 import json
 import os
 import pathlib
 import shutil
 import sys
-import time
+import types
 import urllib.request
 from collections.abc import Callable
 from typing import Any, Optional
@@ -28,8 +33,7 @@ def set_or_update_a_value(
     dictionary: dict,
     key: str,
     value: str,
-    sub_dictionary: Optional[dict | list] = None,
-) -> dict:  # type: ignore
+) -> dict:
     """Set or update a value in a dictionary for the given key. For example, a key can
     be `cv.sections.education.3.institution` and the value can be "Bogazici University".
 
@@ -37,48 +41,34 @@ def set_or_update_a_value(
         dictionary: The dictionary to set or update the value.
         key: The key to set or update the value.
         value: The value to set or update.
-        sub_dictionary: The sub dictionary to set or update the value. This is used for
-            recursive calls. Defaults to None.
-    """
-    # Recursively call this function until the last key is reached:
 
+    Returns:
+        The updated dictionary.
+    """
     keys = key.split(".")
 
-    updated_dict = sub_dictionary if sub_dictionary is not None else dictionary
-
-    if len(keys) == 1:
-        # Set the value:
-        if value.startswith("{") and value.endswith("}"):
-            # Allow users to assign dictionaries:
-            value = eval(value)
-        elif value.startswith("[") and value.endswith("]"):
-            # Allow users to assign lists:
-            value = eval(value)
-
-        if isinstance(updated_dict, list):
-            key = int(key)  # type: ignore
+    # Walk down to the dictionary or list that contains the last key. Create the
+    # dictionaries on the way if they don't exist:
+    sub_dictionary: dict | list = dictionary
+    for sub_key in keys[:-1]:
+        if isinstance(sub_dictionary, list):
+            sub_dictionary = sub_dictionary[int(sub_key)]
+        else:
+            sub_dictionary = sub_dictionary.setdefault(sub_key, {})
 
-        updated_dict[key] = value  # type: ignore
+    # Set the value. Allow users to assign dictionaries and lists, but only as
+    # literals (not as arbitrary Python expressions):
+    if (value.startswith("{") and value.endswith("}")) or (
+        value.startswith("[") and value.endswith("]")
+    ):
+        value = ast.literal_eval(value)
 
+    if isinstance(sub_dictionary, list):
+        sub_dictionary[int(keys[-1])] = value
     else:
-        # get the first key and call the function with remaining keys:
-        first_key = keys[0]
-        key = ".".join(keys[1:])
+        sub_dictionary[keys[-1]] = value
 
-        if isinstance(updated_dict, list):
-            first_key = int(first_key)
-
-        if isinstance(first_key, int) or first_key in updated_dict:
-            # Key exists, get the sub dictionary:
-            sub_dictionary = updated_dict[first_key]  # type: ignore
-        else:
-            # Key does not exist, create a new sub dictionary:
-            sub_dictionary = {}
-
-        updated_sub_dict = set_or_update_a_value(dictionary, key, value, sub_dictionary)
-        updated_dict[first_key] = updated_sub_dict  # type: ignore
-
-    return updated_dict  # type: ignore
+    return dictionary
 
 
 def set_or_update_values(
@@ -93,7 +83,7 @@ def set_or_update_values(
         key_and_values: The key and value pairs to set or update.
     """
     for key, value in key_and_values.items():
-        dictionary = set_or_update_a_value(dictionary, key, value)  # type: ignore
+        dictionary = set_or_update_a_value(dictionary, key, value)
 
     return dictionary
 
@@ -109,17 +99,30 @@ def copy_files(paths: list[pathlib.Path] | pathlib.Path, new_path: pathlib.Path)
     if isinstance(paths, pathlib.Path):
         paths = [paths]
 
+    # The output files are freshly generated, so their metadata doesn't need to be
+    # copied. `shutil.copyfile` skips the extra `stat` calls of `shutil.copy2`.
+    new_path = pathlib.Path(new_path)
     if len(paths) == 1:
-        shutil.copy2(paths[0], new_path)
+        if new_path.is_dir():
+            new_path = new_path / paths[0].name
+        shutil.copyfile(paths[0], new_path)
     else:
-        for i, file_path in enumerate(paths):
-            # append a number to the end of the path:
-            number = i + 1
-            png_path_with_page_number = (
-                pathlib.Path(new_path).parent
-                / f"{pathlib.Path(new_path).stem}_{number}.png"
-            )
-            shutil.copy2(file_path, png_path_with_page_number)
+        parent = new_path.parent
+        stem = new_path.stem
+        # append a number to the end of the path:
+        new_paths = [parent / f"{stem}_{i + 1}.png" for i in range(len(paths))]
+        if len(paths) > 4:
+            # The copies are independent of each other and I/O-bound, so overlap them
+            # with threads:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1)
+            ) as executor:
+                list(executor.map(shutil.copyfile, paths, new_paths))
+        else:
+            for file_path, png_path_with_page_number in zip(
+                paths, new_paths, strict=True
+            ):
+                shutil.copyfile(file_path, png_path_with_page_number)
 
 
 def get_latest_version_number_from_pypi() -> Optional[str]:
@@ -139,10 +142,10 @@ def get_latest_version_number_from_pypi() -> Optional[str]:
     version = None
     url = "https://pypi.org/pypi/rendercv/json"
     try:
-        with urllib.request.urlopen(url) as response:
-            data = response.read()
-            encoding = response.info().get_content_charset("utf-8")
-            json_data = json.loads(data.decode(encoding))
+        # Don't let a slow connection to PyPI hold the CLI up:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            # `json.load` takes the bytes as they are and detects the encoding itself:
+            json_data = json.load(response)
             version = json_data["info"]["version"]
     except Exception:
         pass
@@ -150,6 +153,10 @@ def get_latest_version_number_from_pypi() -> Optional[str]:
     return version
 
 
+# Create a set of the file and folder names that shouldn't be copied with the templates:
+ignored_template_file_names = frozenset({"__init__.py", "__pycache__"})
+
+
 def copy_templates(
     folder_name: str,
     copy_to: pathlib.Path,
@@ -173,11 +180,13 @@ def copy_templates(
 
     if destination.exists():
         return None
-    # copy the folder but don't include __init__.py:
+    # copy the folder but don't include __init__.py. The names are plain names, so a set
+    # lookup is enough, there is no need for the glob matching of
+    # `shutil.ignore_patterns`:
     shutil.copytree(
         template_directory,
         destination,
-        ignore=shutil.ignore_patterns("__init__.py", "__pycache__"),
+        ignore=lambda _, names: ignored_template_file_names.intersection(names),
     )
 
     return destination
@@ -226,8 +235,11 @@ def parse_render_command_override_arguments(
     return key_and_values
 
 
-def get_default_render_command_cli_arguments() -> dict:
-    """Get the default values of the `render` command's CLI arguments.
+@functools.lru_cache(maxsize=1)
+def get_default_render_command_cli_arguments() -> types.MappingProxyType[str, Any]:
+    """Get the default values of the `render` command's CLI arguments. The result is
+    cached because the signature of the `render` command never changes, and it's
+    returned as a read-only mapping so that the cached values can't be modified.
 
     Returns:
         The default values of the `render` command's CLI arguments.
@@ -235,11 +247,13 @@ def get_default_render_command_cli_arguments() -> dict:
     from .commands import cli_command_render
 
     sig = inspect.signature(cli_command_render)
-    return {
-        k: v.default
-        for k, v in sig.parameters.items()
-        if v.default is not inspect.Parameter.empty
-    }
+    return types.MappingProxyType(
+        {
+            k: v.default
+            for k, v in sig.parameters.items()
+            if v.default is not inspect.Parameter.empty
+        }
+    )
 
 
 def update_render_command_settings_of_the_input_file(
@@ -263,22 +277,27 @@ def update_render_command_settings_of_the_input_file(
     # value, overwrite the value in the input file's `rendercv_settings.render_command`
     # field. If the field is the default value, check if it exists in the input file.
     # If it doesn't exist, add it to the input file. If it exists, don't do anything.
-    if "rendercv_settings" not in input_file_as_a_dict:
-        input_file_as_a_dict["rendercv_settings"] = {}
-
-    if "render_command" not in input_file_as_a_dict["rendercv_settings"]:
-        input_file_as_a_dict["rendercv_settings"]["render_command"] = {}
-
-    render_command_field = input_file_as_a_dict["rendercv_settings"]["render_command"]
+    rendercv_settings_field = input_file_as_a_dict.get("rendercv_settings") or {}
+    render_command_field = rendercv_settings_field.get("render_command") or {}
+
+    # If the input file already has all the arguments and none of them is overridden
+    # in the CLI, there is nothing to update. Return the input file as it is:
+    if render_command_field.keys() >= render_command_cli_arguments.keys() and all(
+        value == default_render_command_cli_arguments[key]
+        for key, value in render_command_cli_arguments.items()
+    ):
+        return input_file_as_a_dict
+
+    render_command_field = input_file_as_a_dict.setdefault(
+        "rendercv_settings", {}
+    ).setdefault("render_command", {})
     for key, value in render_command_cli_arguments.items():
         if (
-            value != default_render_command_cli_arguments[key]
-            or key not in render_command_field
+            key not in render_command_field
+            or value != default_render_command_cli_arguments[key]
         ):
             render_command_field[key] = value
 
-    input_file_as_a_dict["rendercv_settings"]["render_command"] = render_command_field
-
     return input_file_as_a_dict
 
 
@@ -432,18 +451,25 @@ def run_a_function_if_a_file_changes(file_path: pathlib.Path, function: Callable
     # Run the function immediately for the first time
     function()
 
-    path_to_watch = str(file_path.absolute())
+    watched_file_path = str(file_path.absolute())
+    path_to_watch = watched_file_path
     if sys.platform == "win32":
         # Windows does not support single file watching, so we watch the directory
         path_to_watch = str(file_path.parent.absolute())
 
-    class EventHandler(watchdog.events.FileSystemEventHandler):
+    class EventHandler(watchdog.events.PatternMatchingEventHandler):
         def __init__(self, function: Callable):
-            super().__init__()
+            # Let watchdog drop the events of the other files before they reach
+            # `on_modified`:
+            super().__init__(
+                patterns=[glob.escape(file_path.name)],
+                ignore_directories=True,
+                case_sensitive=True,
+            )
             self.function_to_call = function
 
         def on_modified(self, event: watchdog.events.FileModifiedEvent) -> None:
-            if event.src_path != str(file_path.absolute()):
+            if event.src_path != watched_file_path:
                 return
 
             printer.information(
@@ -454,16 +480,56 @@ def run_a_function_if_a_file_changes(file_path: pathlib.Path, function: Callable
     event_handler = EventHandler(function)
 
     observer = watchdog.observers.Observer()
-    observer.schedule(event_handler, path_to_watch, recursive=True)
+    observer.schedule(event_handler, path_to_watch, recursive=False)
     observer.start()
+
+    # Block on the observer thread until Ctrl+C instead of sleeping in a loop. The
+    # wait is interrupted by KeyboardInterrupt on POSIX, but not on Windows, so wake
+    # up once a second there:
+    timeout = 1 if sys.platform == "win32" else None
     try:
-        while True:
-            time.sleep(1)
+        while observer.is_alive():
+            observer.join(timeout)
     except KeyboardInterrupt:
         observer.stop()
     observer.join()
 
 
+# Create a cache for the individual `design`, `locale`, etc. files. The keys are the file
+# paths and the values are the modification times, sizes, and contents of the files:
+yaml_files_cache: dict[pathlib.Path, tuple[int, int, dict]] = {}
+
+
+def read_a_yaml_file_with_cache(file_path: pathlib.Path) -> dict:
+    """Read a YAML file, or return its cached content if the file hasn't been modified
+    since the last time it was read. In watch mode, the individual `design`, `locale`,
+    etc. files are usually not the ones that change, so they don't need to be parsed
+    again on every re-run.
+
+    Args:
+        file_path: The path to the YAML file.
+
+    Returns:
+        The content of the YAML file as a dictionary.
+    """
+    if not file_path.exists():
+        # Let `data.read_a_yaml_file` raise the error:
+        return data.read_a_yaml_file(file_path)
+
+    # The size is checked too, because the timestamps of some file systems are too
+    # coarse to tell apart two quick edits:
+    file_stat = file_path.stat()
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached_file = yaml_files_cache.get(file_path)
+    if cached_file is None or cached_file[:2] != file_version:
+        cached_file = (*file_version, data.read_a_yaml_file(file_path))
+        yaml_files_cache[file_path] = cached_file
+
+    # The callers update the dictionary (with the override arguments, for example), so
+    # don't give them the cached one:
+    return copy.deepcopy(cached_file[2])
+
+
 def read_and_construct_the_input(
     input_file_path: pathlib.Path,
     cli_render_arguments: dict[str, Any],
@@ -489,7 +555,7 @@ def read_and_construct_the_input(
     for field in data.rendercv_data_model_fields:
         if field in cli_render_arguments and cli_render_arguments[field] is not None:
             yaml_path = pathlib.Path(cli_render_arguments[field]).absolute()
-            yaml_file_as_a_dict = data.read_a_yaml_file(yaml_path)
+            yaml_file_as_a_dict = read_a_yaml_file_with_cache(yaml_path)
             input_file_as_a_dict[field] = yaml_file_as_a_dict[field]
 
     # Update the input file if there are extra override arguments (for example,
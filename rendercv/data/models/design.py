@@ -3,6 +3,7 @@ The `rendercv.data.models.design` module contains the data model of the `design`
 of the input file.
 """
 
+import functools
 import importlib
 import importlib.util
 import os
@@ -18,6 +19,7 @@ from ...themes import (
     ModerncvThemeOptions,
     Sb2novThemeOptions,
 )
+from ...themes.options import ThemeOptions
 from . import entry_types
 from .base import RenderCVBaseModelWithoutExtraKeys
 
@@ -26,10 +28,101 @@ from .base import RenderCVBaseModelWithoutExtraKeys
 # ======================================================================================
 
 
+class ThemeOptionsAreNotProvided(RenderCVBaseModelWithoutExtraKeys):
+    """This class is the data model of the custom themes that don't have an
+    `__init__.py` file. It only stores the name of the theme. It's defined once here
+    instead of being created for every validation.
+    """
+
+    theme: str
+
+
+# Create a tuple of the base classes of the validated design options. All the built-in
+# themes, and the custom themes that are based on them, are `ThemeOptions`:
+theme_data_model_types = (ThemeOptions, ThemeOptionsAreNotProvided)
+
+# Create a cache for the data models of the custom themes. The keys are the paths of the
+# `__init__.py` files and the values are their modification times, sizes, and the data
+# models imported from them. Only the latest version of each file is kept:
+custom_theme_data_models_cache: dict[pathlib.Path, tuple[int, int, type]] = {}
+
+# Create a set of the data models in the cache above, to recognize the already
+# validated custom themes:
+custom_theme_data_model_types: set[type] = set()
+
+
+def import_the_custom_theme_data_model(
+    theme_name: str, path_to_init_file: pathlib.Path
+) -> type:
+    """Import the `__init__.py` file of a custom theme and return the data model of the
+    theme's design options, which is named `<ThemeName>ThemeOptions`.
+
+    Args:
+        theme_name: The name of the custom theme.
+        path_to_init_file: The path to the `__init__.py` file of the custom theme.
+
+    Returns:
+        The data model of the custom theme.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "theme",
+        path_to_init_file,
+    )
+
+    theme_module = importlib.util.module_from_spec(spec)  # type: ignore
+    try:
+        spec.loader.exec_module(theme_module)  # type: ignore
+    except SyntaxError as e:
+        message = (
+            f"The custom theme {theme_name}'s __init__.py file has a syntax"
+            " error. Please fix it."
+        )
+        raise ValueError(message) from e
+    except ImportError as e:
+        message = (
+            f"The custom theme {theme_name}'s __init__.py file has an"
+            " import error. If you have copy-pasted RenderCV's built-in"
+            " themes, make sure to update the import statements (e.g.,"
+            ' "from . import" to "from rendercv.themes import").'
+        )
+
+        raise ValueError(message) from e
+
+    return getattr(
+        theme_module,
+        f"{theme_name.capitalize()}ThemeOptions",  # type: ignore
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_required_custom_theme_files(
+    available_entry_type_names: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Get the names of the template files that a custom theme folder should contain.
+    The names only depend on the available entry types, so they are computed once.
+
+    Args:
+        available_entry_type_names: The available entry type names.
+
+    Returns:
+        The names of the required template files.
+    """
+    required_entry_files = [
+        entry_type_name + ".j2.typ" for entry_type_name in available_entry_type_names
+    ]
+    return (
+        "SectionBeginning.j2.typ",  # section beginning template
+        "SectionEnding.j2.typ",  # section ending template
+        "Preamble.j2.typ",  # preamble template
+        "Header.j2.typ",  # header template
+        *required_entry_files,
+    )
+
+
 def validate_design_options(
     design: Any,
     available_theme_options: dict[str, type],
-    available_entry_type_names: list[str],
+    available_entry_type_names: tuple[str, ...],
 ) -> Any:
     """Chech if the design options are for a built-in theme or a custom theme. If it is
     a built-in theme, validate it with the corresponding data model. If it is a custom
@@ -48,18 +141,25 @@ def validate_design_options(
     """
     from .rendercv_data_model import INPUT_FILE_DIRECTORY
 
-    original_working_directory = pathlib.Path.cwd()
-
-    # Change the working directory to the input file directory:
-
-    if isinstance(design, tuple(available_theme_options.values())):
-        # Then it means it is an already validated built-in theme. Return it as it is:
+    if isinstance(design, theme_data_model_types) or (
+        type(design) in custom_theme_data_model_types
+    ):
+        # Then it means it is an already validated built-in or custom theme (custom
+        # themes don't have to be based on `ThemeOptions`, so the imported custom
+        # theme data models are checked too). Return it as it is:
         return design
+    if not isinstance(design, dict):
+        message = (
+            "The design field should contain the design options, not a single value."
+            ' For example, use "design: {theme: classic}" instead of "design: classic".'
+        )
+        raise ValueError(message)
     if design["theme"] in available_theme_options:
         # Then it is a built-in theme, but it is not validated yet. Validate it and
-        # return it:
+        # return it. `model_validate` hands the dictionary to pydantic-core as is,
+        # without unpacking it into keyword arguments first:
         ThemeDataModel = available_theme_options[design["theme"]]
-        return ThemeDataModel(**design)
+        return ThemeDataModel.model_validate(design)
     # It is a custom theme. Validate it:
     theme_name: str = str(design["theme"])
 
@@ -79,38 +179,29 @@ def validate_design_options(
 
     custom_theme_folder = theme_parent_folder / theme_name
 
-    # Check if the custom theme folder exists:
-    if not custom_theme_folder.exists():
+    # Check if the custom theme folder exists, and list its contents with a single
+    # system call instead of checking each file separately:
+    try:
+        with os.scandir(custom_theme_folder) as entries:
+            custom_theme_files = {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         message = (
-            (
-                f"The custom theme folder `{custom_theme_folder}` does not exist."
-                " It should be in the working directory as the input file."
-            ),
+            f"The custom theme folder `{custom_theme_folder}` does not exist."
+            " It should be in the working directory as the input file."
         )
         raise ValueError(
             message,
             "",  # this is the location of the error
             theme_name,  # this is value of the error
-        )
+        ) from None
 
     # check if all the necessary files are provided in the custom theme folder:
-    required_entry_files = [
-        custom_theme_folder / (entry_type_name + ".j2.typ")
-        for entry_type_name in available_entry_type_names
-    ]
-    required_files = [
-        custom_theme_folder / "SectionBeginning.j2.typ",  # section beginning template
-        custom_theme_folder / "SectionEnding.j2.typ",  # section ending template
-        custom_theme_folder / "Preamble.j2.typ",  # preamble template
-        custom_theme_folder / "Header.j2.typ",  # header template
-        *required_entry_files,
-    ]
-
-    for file in required_files:
-        if not file.exists():
+    for file_name in get_required_custom_theme_files(available_entry_type_names):
+        if file_name not in custom_theme_files:
             message = (
-                f"You provided a custom theme, but the file `{file}` is not"
-                f" found in the folder `{custom_theme_folder}`."
+                "You provided a custom theme, but the file"
+                f" `{custom_theme_folder / file_name}` is not found in the folder"
+                f" `{custom_theme_folder}`."
             )
             raise ValueError(
                 message,
@@ -121,50 +212,34 @@ def validate_design_options(
     # Import __init__.py file from the custom theme folder if it exists:
     path_to_init_file = custom_theme_folder / "__init__.py"
 
-    if path_to_init_file.exists():
-        spec = importlib.util.spec_from_file_location(
-            "theme",
-            path_to_init_file,
-        )
-
-        theme_module = importlib.util.module_from_spec(spec)  # type: ignore
-        try:
-            spec.loader.exec_module(theme_module)  # type: ignore
-        except SyntaxError as e:
-            message = (
-                f"The custom theme {theme_name}'s __init__.py file has a syntax"
-                " error. Please fix it."
+    if "__init__.py" in custom_theme_files:
+        # Don't import the same __init__.py file again if it hasn't been modified:
+        init_file_stat = custom_theme_files["__init__.py"].stat()
+        init_file_version = (init_file_stat.st_mtime_ns, init_file_stat.st_size)
+        absolute_path_to_init_file = path_to_init_file.absolute()
+        cached_theme = custom_theme_data_models_cache.get(absolute_path_to_init_file)
+        if cached_theme is not None and cached_theme[:2] == init_file_version:
+            ThemeDataModel = cached_theme[2]
+        else:
+            ThemeDataModel = import_the_custom_theme_data_model(
+                theme_name, path_to_init_file
             )
-            raise ValueError(message) from e
-        except ImportError as e:
-            message = (
-                (
-                    f"The custom theme {theme_name}'s __init__.py file has an"
-                    " import error. If you have copy-pasted RenderCV's built-in"
-                    " themes, make sure to update the import statements (e.g.,"
-                    ' "from . import" to "from rendercv.themes import").'
-                ),
+            # Replace the data model of the previous version of the file:
+            if cached_theme is not None:
+                custom_theme_data_model_types.discard(cached_theme[2])
+            custom_theme_data_models_cache[absolute_path_to_init_file] = (
+                *init_file_version,
+                ThemeDataModel,
             )
-
-            raise ValueError(message) from e
-
-        ThemeDataModel = getattr(
-            theme_module,
-            f"{theme_name.capitalize()}ThemeOptions",  # type: ignore
-        )
+            custom_theme_data_model_types.add(ThemeDataModel)
 
         # Initialize and validate the custom theme data model:
         theme_data_model = ThemeDataModel(**design)
     else:
         # Then it means there is no __init__.py file in the custom theme folder.
-        # Create a dummy data model and use that instead.
-        class ThemeOptionsAreNotProvided(RenderCVBaseModelWithoutExtraKeys):
-            theme: str = theme_name
-
+        # Use the dummy data model instead.
         theme_data_model = ThemeOptionsAreNotProvided(theme=theme_name)
 
-    os.chdir(original_working_directory)
-
     return theme_data_model
 
 
@@ -195,17 +270,27 @@ RenderCVBuiltinDesign = Annotated[
     pydantic.Field(discriminator="theme"),
 ]
 
+
+def validate_design_options_of_the_input_file(design: Any) -> Any:
+    """Validate the design options with RenderCV's built-in themes and entry types. This
+    is the validator of the `RenderCVDesign` type.
+
+    Args:
+        design: The design options to validate.
+
+    Returns:
+        The validated design as a Pydantic data model.
+    """
+    return validate_design_options(
+        design, available_theme_options, entry_types.available_entry_type_names
+    )
+
+
 # Create a custom type named RenderCVDesign:
 # RenderCV supports custom themes as well. Therefore, `Any` type is used to allow custom
 # themes. However, the JSON Schema generation is skipped, otherwise, the JSON Schema
 # would accept any `design` field in the YAML input file.
 RenderCVDesign = Annotated[
     pydantic.json_schema.SkipJsonSchema[Any] | RenderCVBuiltinDesign,
-    pydantic.BeforeValidator(
-        lambda design: validate_design_options(
-            design,
-            available_theme_options=available_theme_options,
-            available_entry_type_names=entry_types.available_entry_type_names,  # type: ignore
-        )
-    ),
+    pydantic.BeforeValidator(validate_design_options_of_the_input_file),
 ]
@@ -173,13 +173,28 @@ EndDate = Annotated[
 # ======================================================================================
 
 
+@functools.lru_cache(maxsize=64)
+def get_a_pattern_that_matches_the_keywords(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern that matches any of the given keywords. Longer keywords are
+    tried first so that a keyword that contains another one is matched as a whole.
+
+    Args:
+        keywords: The keywords to match.
+
+    Returns:
+        The compiled pattern.
+    """
+    sorted_keywords = sorted(filter(None, keywords), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, sorted_keywords)))
+
+
 def make_keywords_bold_in_a_string(string: str, keywords: list[str]) -> str:
     """Make the given keywords bold in the given string."""
-    replacement_map = {keyword: f"**{keyword}**" for keyword in keywords}
-    for keyword, replacement in replacement_map.items():
-        string = string.replace(keyword, replacement)
+    if not any(keywords):
+        return string
 
-    return string
+    pattern = get_a_pattern_that_matches_the_keywords(tuple(keywords))
+    return pattern.sub(r"**\g<0>**", string)
 
 
 class OneLineEntry(RenderCVBaseModelWithExtraKeys):
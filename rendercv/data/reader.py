@@ -17,30 +17,44 @@ from .models import entry_types
 def make_given_keywords_bold_in_sections(
     sections_input: models.Sections, keywords: list[str]
 ) -> models.Sections:
-    """Iterate over the dictionary recursively and make the given keywords bold.
+    """Iterate over the entries of the sections and make the given keywords bold. The
+    entries are updated in place, so the sections don't need to be validated again.
 
     Args:
-        sections_input: TODO
+        sections_input: The `sections` field of the CV, after validation.
         keywords: The keywords to make bold.
 
     Returns:
-        The dictionary with the given keywords bold.
+        The sections with the given keywords bold.
     """
     if sections_input is None:
         return None
 
     for entries in sections_input.values():
-        for entry in entries:
+        for i, entry in enumerate(entries):
             if isinstance(entry, str):
-                entry_types.make_keywords_bold_in_a_string(entry, keywords)
-            elif callable(getattr(entry, "make_keywords_bold", None)):
-                entry = entry.make_keywords_bold(  # NOQA: PLW2901 # type: ignore
-                    keywords
+                # Strings are immutable, so replace the entry in the list:
+                entries[i] = entry_types.make_keywords_bold_in_a_string(  # type: ignore
+                    entry, keywords
                 )
+            elif callable(getattr(entry, "make_keywords_bold", None)):
+                entry.make_keywords_bold(keywords)  # type: ignore
 
     return sections_input
 
 
+# Create a pattern for the custom error messages, which look like
+# `('message', 'location', 'input value')`:
+custom_error_pattern = re.compile(r"""\(['"](.*)['"], '(.*)', '(.*)'\)""")
+
+
+# Create a pattern for the location elements that are not locations in the input file
+# but the names of the types that Pydantic tried, such as `int` or `literal['present']`:
+unwanted_location_pattern = re.compile(
+    r"(tagged-union|list|literal|int|constrained-str)(\[.*\])?"
+)
+
+
 def get_error_message_and_location_and_value_from_a_custom_error(
     error_string: str,
 ) -> tuple[Optional[str], Optional[str], Optional[str]]:
@@ -61,8 +75,7 @@ def get_error_message_and_location_and_value_from_a_custom_error(
     Returns:
         The custom message, location, and the input value.
     """
-    pattern = r"""\(['"](.*)['"], '(.*)', '(.*)'\)"""
-    match = re.search(pattern, error_string)
+    match = custom_error_pattern.search(error_string)
     if match:
         return match.group(1), match.group(2), match.group(3)
     return None, None, None
@@ -128,7 +141,10 @@ def parse_validation_errors(
     # This is needed because how dm.validate_section_input function raises an exception.
     # This is done to tell the user which which EntryType RenderCV excepts to see.
     errors = exception.errors()
-    for error_object in errors.copy():
+    # The errors of the entries are collected separately and added at the end, so that
+    # `errors` isn't changed while it's being iterated:
+    entry_errors = []
+    for error_object in errors:
         if (
             "There are problems with the entries." in error_object["msg"]
             and "ctx" in error_object
@@ -146,23 +162,23 @@ def parse_validation_errors(
                         cause_error_object["loc"] = tuple(
                             list(location) + list(cause_error_object["loc"][1:])
                         )
-                    errors.extend(cause_object_errors)
+                    entry_errors.extend(cause_object_errors)
+    errors.extend(entry_errors)
 
     # some locations are not really the locations in the input file, but some
     # information about the model coming from Pydantic. We need to remove them.
     # (e.g. avoid stuff like .end_date.literal['present'])
-    unwanted_locations = ["tagged-union", "list", "literal", "int", "constrained-str"]
     for error_object in errors:
-        location = [str(location_element) for location_element in error_object["loc"]]
-        new_location = [str(location_element) for location_element in location]
-        for location_element in location:
-            for unwanted_location in unwanted_locations:
-                if unwanted_location in location_element:
-                    new_location.remove(location_element)
-        error_object["loc"] = new_location  # type: ignore
+        error_object["loc"] = [  # type: ignore
+            str(location_element)
+            for location_element in error_object["loc"]
+            if not unwanted_location_pattern.fullmatch(str(location_element))
+        ]
 
     # Parse all the errors and create a new list of errors.
     new_errors: list[dict[str, str]] = []
+    # (location, message, input) of the errors in new_errors, to skip duplicates:
+    seen_errors: set[tuple[str, str, str]] = set()
     for error_object in errors:
         message = error_object["msg"]
         location = ".".join(error_object["loc"])  # type: ignore
@@ -208,7 +224,9 @@ def parse_validation_errors(
         }
 
         # if new_error is not in new_errors, then add it to new_errors
-        if new_error not in new_errors:
+        error_key = (location, message, str(input))
+        if error_key not in seen_errors:
+            seen_errors.add(error_key)
             new_errors.append(new_error)
 
     return new_errors
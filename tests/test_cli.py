@@ -1,3 +1,4 @@
+import copy
 import multiprocessing as mp
 import os
 import pathlib
@@ -80,6 +81,26 @@ def test_get_error_message_and_location_and_value_from_a_custom_error():
     assert result == (None, None, None)
 
 
+def test_parse_validation_errors_removes_only_pydantic_type_names_from_locations():
+    try:
+        data.CurriculumVitae(
+            name="John Doe",
+            sections={
+                "interests": [
+                    {
+                        "company": "CERN",
+                        "position": "Researcher",
+                        "date": [2020],
+                    },
+                ],
+            },
+        )
+    except pydantic.ValidationError as e:
+        locations = [error["loc"] for error in data.parse_validation_errors(e)]
+
+    assert ("sections", "interests", "0", "date") in locations
+
+
 @pytest.mark.parametrize(
     ("data_model_class", "invalid_model"),
     [
@@ -253,6 +274,35 @@ def test_copy_templates_destinations_exist(tmp_path, folder_name):
     assert copied_path is None
 
 
+@pytest.mark.parametrize("number_of_files", [1, 3, 10])
+@pytest.mark.parametrize("copy_to_a_folder", [True, False])
+def test_copy_files(tmp_path, number_of_files, copy_to_a_folder):
+    source_folder = tmp_path / "source"
+    source_folder.mkdir()
+    paths = []
+    for i in range(number_of_files):
+        path = source_folder / f"John_Doe_CV_{i + 1}.png"
+        path.write_text(str(i))
+        paths.append(path)
+
+    new_path = tmp_path / "CV.png"
+    if copy_to_a_folder:
+        new_path = tmp_path / "destination"
+        new_path.mkdir()
+
+    utilities.copy_files(paths, new_path)
+
+    if number_of_files == 1:
+        expected_paths = [new_path / paths[0].name if copy_to_a_folder else new_path]
+    else:
+        expected_paths = [
+            new_path.parent / f"{new_path.stem}_{i + 1}.png"
+            for i in range(number_of_files)
+        ]
+    for i, expected_path in enumerate(expected_paths):
+        assert expected_path.read_text() == str(i)
+
+
 runner = typer.testing.CliRunner()
 
 
@@ -754,6 +804,58 @@ def test_set_or_update_a_value(rendercv_data_model, key, value):
         assert eval(f"updated_model.{key}") == value
 
 
+def test_set_or_update_a_value_doesnt_evaluate_expressions():
+    with pytest.raises(ValueError, match="malformed"):
+        utilities.set_or_update_a_value({}, "cv.name", '[__import__("os").getcwd()]')
+
+
+def test_update_render_command_settings_of_the_input_file():
+    input_file_as_a_dict = {
+        "rendercv_settings": {"render_command": {"dont_generate_png": True}}
+    }
+    cli_arguments = {"dont_generate_png": False, "output_folder_name": "output"}
+
+    result = utilities.update_render_command_settings_of_the_input_file(
+        input_file_as_a_dict, cli_arguments
+    )
+
+    # The default value doesn't overwrite the input file, the new value does:
+    assert result["rendercv_settings"]["render_command"] == {
+        "dont_generate_png": True,
+        "output_folder_name": "output",
+    }
+
+
+def test_update_render_command_settings_of_the_input_file_without_overrides():
+    input_file_as_a_dict = {
+        "rendercv_settings": {
+            "render_command": {"dont_generate_png": True, "output_folder_name": "out"}
+        }
+    }
+    expected_input_file_as_a_dict = copy.deepcopy(input_file_as_a_dict)
+    # All the arguments are at their default values:
+    cli_arguments = {
+        "dont_generate_png": False,
+        "output_folder_name": "rendercv_output",
+    }
+
+    result = utilities.update_render_command_settings_of_the_input_file(
+        input_file_as_a_dict, cli_arguments
+    )
+
+    assert result is input_file_as_a_dict
+    assert result == expected_input_file_as_a_dict
+
+
+def test_get_default_render_command_cli_arguments_is_cached_and_read_only():
+    default_arguments = utilities.get_default_render_command_cli_arguments()
+
+    assert utilities.get_default_render_command_cli_arguments() is default_arguments
+    assert default_arguments["dont_generate_png"] is False
+    with pytest.raises(TypeError):
+        default_arguments["dont_generate_png"] = True  # type: ignore
+
+
 @pytest.mark.parametrize(
     ("key", "value"),
     [
@@ -944,6 +1046,34 @@ def test_watcher(tmp_path, input_file_path):
     assert (tmp_path / "rendercv_output" / "Jane_Doe_CV.pdf").exists()
 
 
+def test_watcher_reruns_use_the_cli_arguments(
+    tmp_path, input_file_path, design_file_path, monkeypatch
+):
+    rendered_inputs = []
+    monkeypatch.setattr(
+        utilities,
+        "run_rendercv_with_printer",
+        lambda input_file_as_a_dict, *_: rendered_inputs.append(input_file_as_a_dict),
+    )
+    # Run the function twice: once at the start and once for a file change.
+    monkeypatch.setattr(
+        utilities,
+        "run_a_function_if_a_file_changes",
+        lambda _, function: (function(), function()),
+    )
+
+    run_render_command(
+        input_file_path,
+        tmp_path,
+        ["--watch", "--design", str(design_file_path), "--cv.name", "Jane Doe"],
+    )
+
+    assert len(rendered_inputs) == 2
+    for input_file_as_a_dict in rendered_inputs:
+        assert input_file_as_a_dict["cv"]["name"] == "Jane Doe"
+        assert input_file_as_a_dict["design"] == {"theme": "classic"}
+
+
 def test_watcher_with_errors(tmp_path, input_file_path):
     # run this in a separate process:
     p = mp.Process(
@@ -1015,3 +1145,31 @@ def test_read_and_construct_the_input(
             assert (field in input_dict) == locals()[
                 field
             ], f"{field} is in dict: {field in input_dict}, expected: {locals()[field]}"
+
+
+def test_read_a_yaml_file_with_cache(tmp_path):
+    yaml_path = tmp_path / "design.yaml"
+    yaml_path.write_text("design:\n  theme: classic\n", encoding="utf-8")
+
+    first_read = utilities.read_a_yaml_file_with_cache(yaml_path)
+    first_read["design"]["theme"] = "changed by the caller"
+
+    # The cached content can't be changed by the callers:
+    assert utilities.read_a_yaml_file_with_cache(yaml_path) == {
+        "design": {"theme": "classic"}
+    }
+
+    # The file is read again after it's modified:
+    yaml_path.write_text("design:\n  theme: sb2nov\n", encoding="utf-8")
+    modification_time = yaml_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(yaml_path, ns=(modification_time, modification_time))
+    assert utilities.read_a_yaml_file_with_cache(yaml_path) == {
+        "design": {"theme": "sb2nov"}
+    }
+
+    # The file is read again if its size changes, even if its timestamp doesn't:
+    yaml_path.write_text("design:\n  theme: moderncv\n", encoding="utf-8")
+    os.utime(yaml_path, ns=(modification_time, modification_time))
+    assert utilities.read_a_yaml_file_with_cache(yaml_path) == {
+        "design": {"theme": "moderncv"}
+    }
@@ -13,6 +13,7 @@ from rendercv.data import generator
 from rendercv.data.models import (
     computers,
     curriculum_vitae,
+    design,
     entry_types,
     locale,
 )
@@ -615,6 +616,19 @@ def test_invalid_custom_theme(invalid_custom_theme_name):
         )
 
 
+def test_missing_custom_theme_folder_error_message(tmp_path):
+    os.chdir(tmp_path)
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design={"theme": "pathdoesntexist"},
+        )
+
+    errors = data.parse_validation_errors(exc_info.value)
+    assert errors[0]["msg"].startswith("The custom theme folder")
+    assert errors[0]["input"] == "pathdoesntexist"
+
+
 def test_custom_theme_with_missing_files(tmp_path):
     custom_theme_path = tmp_path / "customtheme"
     custom_theme_path.mkdir()
@@ -626,6 +640,16 @@ def test_custom_theme_with_missing_files(tmp_path):
         )
 
 
+def test_custom_theme_that_is_a_file(tmp_path):
+    (tmp_path / "customtheme").write_text("not a folder", encoding="utf-8")
+    os.chdir(tmp_path)
+    with pytest.raises(pydantic.ValidationError, match="does not exist"):
+        data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design={"theme": "customtheme"},
+        )
+
+
 def test_custom_theme(testdata_directory_path):
     os.chdir(
         testdata_directory_path
@@ -639,6 +663,85 @@ def test_custom_theme(testdata_directory_path):
     assert data_model.design.theme == "dummytheme"
 
 
+def test_custom_theme_data_model_is_imported_once(tmp_path, testdata_directory_path):
+    shutil.copytree(
+        testdata_directory_path
+        / "test_copy_theme_files_to_output_directory_custom_theme"
+        / "dummytheme",
+        tmp_path / "dummytheme",
+    )
+    os.chdir(tmp_path)
+
+    design_models = [
+        data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design={"theme": "dummytheme"},
+        ).design
+        for _ in range(2)
+    ]
+
+    assert type(design_models[0]) is type(design_models[1])
+
+
+def test_custom_theme_data_model_is_replaced_when_init_file_changes(
+    tmp_path, testdata_directory_path
+):
+    shutil.copytree(
+        testdata_directory_path
+        / "test_copy_theme_files_to_output_directory_custom_theme"
+        / "dummytheme",
+        tmp_path / "dummytheme",
+    )
+    os.chdir(tmp_path)
+
+    def validate_the_design():
+        return data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design={"theme": "dummytheme"},
+        ).design
+
+    old_design = validate_the_design()
+
+    init_file = tmp_path / "dummytheme" / "__init__.py"
+    init_file.write_text(init_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    new_design = validate_the_design()
+
+    assert type(old_design) is not type(new_design)
+    cached_theme = design.custom_theme_data_models_cache[init_file.absolute()]
+    assert cached_theme[2] is type(new_design)
+    assert type(old_design) not in design.custom_theme_data_model_types
+
+
+def test_validated_custom_theme_can_be_validated_again(testdata_directory_path):
+    os.chdir(
+        testdata_directory_path
+        / "test_copy_theme_files_to_output_directory_custom_theme"
+    )
+    design = data.RenderCVDataModel(
+        cv={"name": "John Doe"},  # type: ignore
+        design={"theme": "dummytheme"},
+    ).design
+
+    data_model = data.RenderCVDataModel(
+        cv={"name": "John Doe"},  # type: ignore
+        design=design,
+    )
+
+    assert data_model.design is design
+
+
+@pytest.mark.parametrize(
+    "design",
+    [data.CurriculumVitae(name="John Doe"), "classic"],
+)
+def test_design_should_be_design_options(design):
+    with pytest.raises(pydantic.ValidationError, match="should contain the design"):
+        data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design=design,
+        )
+
+
 def test_custom_theme_without_init_file(tmp_path, testdata_directory_path):
     reference_custom_theme_path = (
         testdata_directory_path
@@ -690,7 +793,7 @@ def test_custom_theme_with_broken_init_file(tmp_path, testdata_directory_path):
     init_file.write_text("from ... import test", encoding="utf-8")
 
     os.chdir(tmp_path)
-    with pytest.raises(pydantic.ValidationError):
+    with pytest.raises(pydantic.ValidationError, match="Value error, The custom"):
         data.RenderCVDataModel(
             cv={"name": "John Doe"},  # type: ignore
             design={"theme": "dummytheme"},
@@ -876,15 +979,52 @@ def test_render_command_settings_placeholders(path_name, expected_value):
     assert render_command_settings.output_folder_name == expected_value
 
 
-def test_make_keywords_bold_in_a_string():
-    assert (
-        data.make_keywords_bold_in_a_string(
+@pytest.mark.parametrize(
+    ("string", "keywords", "expected_string"),
+    [
+        (
             "This is a test string with some keywords.",
             ["test", "keywords"],
-        )
-        == "This is a **test** string with some **keywords**."
+            "This is a **test** string with some **keywords**.",
+        ),
+        (
+            "Experienced in Python 3 and C++.",
+            ["Python", "Python 3", "C++"],
+            "Experienced in **Python 3** and **C++**.",
+        ),
+        ("This string has no keywords.", [], "This string has no keywords."),
+    ],
+)
+def test_make_keywords_bold_in_a_string(string, keywords, expected_string):
+    assert data.make_keywords_bold_in_a_string(string, keywords) == expected_string
+
+
+def test_bold_keywords_are_applied_when_the_input_is_validated():
+    input_dictionary = {
+        "cv": {
+            "name": "John Doe",
+            "sections": {
+                "summary": ["I like Python."],
+                "experience": [
+                    {
+                        "company": "Test Company",
+                        "position": "Test Position",
+                        "highlights": ["Wrote Python code."],
+                    }
+                ],
+            },
+        },
+        "rendercv_settings": {"bold_keywords": ["Python"]},
+    }
+
+    data_model = data.validate_input_dictionary_and_return_the_data_model(
+        input_dictionary
     )
 
+    sections = data_model.cv.sections_input
+    assert sections["summary"][0] == "I like **Python**."  # type: ignore
+    assert sections["experience"][0].highlights[0] == "Wrote **Python** code."  # type: ignore
+
 
 def test_bold_keywords():
     data_model = data.RenderCVDataModel(